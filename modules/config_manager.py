@@ -19,6 +19,8 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "table_column_widths": [],
     "table_header_state": None,
     "table_sort": {"column": 0, "order": "asc"},
+    # Konsolidierter UI-Zustand (Base64); ersetzt die Einzel-Hex-Keys oben
+    "ui_state": None,
     "auto_generate_certificates": True,
 }
 
@@ -265,10 +265,9 @@ def scan_megaraid_devices() -> List[Dict]:
 
 
 def _handle_storcli_error(exc: Exception, context: str) -> None:
-    message = str(exc)
-    if "storcli-Binary nicht gefunden" in message:
+    if isinstance(exc, raid_storcli.StorCLINotFoundError):
         _set_warning("StorCLI nicht installiert/gefunden")
-    elif "sudo-Passwort nicht konfiguriert" in message or "sudo-Authentifizierung fehlgeschlagen" in message:
+    elif isinstance(exc, raid_storcli.StorCLISudoError):
         _set_warning("StorCLI: Sudo-Authentifizierung fehlgeschlagen (Passwort in den Einstellungen prüfen)")
     else:
         _set_warning(f"StorCLI Fehler ({context}): {exc}")
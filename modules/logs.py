@@ -55,6 +55,19 @@ def _wipe_log_path() -> str:
 def append_wipe_log(entry: Dict) -> None:
     """Schreibt einen Eintrag in wipe_log.csv (Semikolon-getrennt)."""
 
+    append_wipe_logs([entry])
+
+
+def append_wipe_logs(entries) -> None:
+    """Schreibt mehrere Einträge in einem einzigen open()-Aufruf.
+
+    Wird vom Hintergrund-Writer des Hauptfensters genutzt, damit
+    Multi-Device-Läufe nicht pro Gerät eine Datei öffnen und syncen.
+    """
+
+    if not entries:
+        return
+
     path = _wipe_log_path()
     os.makedirs(os.path.dirname(path), exist_ok=True)
     fieldnames = [
@@ -79,31 +92,28 @@ def append_wipe_log(entry: Dict) -> None:
         "mapping_hint",
     ]
 
-    normalized = entry.copy() if isinstance(entry, dict) else {}
-    timestamp = normalized.get("timestamp") or normalized.get("end_timestamp")
-    if not timestamp:
-        timestamp = normalized.get("start_timestamp")
-    if not timestamp:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    normalized.setdefault("timestamp", timestamp)
-    normalized.setdefault("start_timestamp", normalized.get("start_timestamp") or timestamp)
-    normalized.setdefault("end_timestamp", normalized.get("end_timestamp") or timestamp)
-    normalized.setdefault("erase_tool", normalized.get("erase_tool", ""))
-    normalized.setdefault("erase_method", normalized.get("erase_method", ""))
-    normalized.setdefault("erase_standard", normalized.get("erase_standard", ""))
-    normalized.setdefault("transport", normalized.get("transport", ""))
-    normalized.setdefault("fio_ok", normalized.get("fio_ok"))
-    normalized.setdefault("mapping_hint", normalized.get("mapping_hint", ""))
-
-    missing_fields = [key for key in fieldnames if key not in normalized]
-    if missing_fields:
-        logger.warning("wipe_log: fehlende Felder ergänzt: %s", ", ".join(sorted(missing_fields)))
+    rows = []
+    for entry in entries:
+        normalized = entry.copy() if isinstance(entry, dict) else {}
+        timestamp = normalized.get("timestamp") or normalized.get("end_timestamp")
+        if not timestamp:
+            timestamp = normalized.get("start_timestamp")
+        if not timestamp:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        normalized.setdefault("timestamp", timestamp)
+        normalized.setdefault("start_timestamp", normalized.get("start_timestamp") or timestamp)
+        normalized.setdefault("end_timestamp", normalized.get("end_timestamp") or timestamp)
+        normalized.setdefault("erase_tool", normalized.get("erase_tool", ""))
+        normalized.setdefault("erase_method", normalized.get("erase_method", ""))
+        normalized.setdefault("erase_standard", normalized.get("erase_standard", ""))
+        normalized.setdefault("transport", normalized.get("transport", ""))
+        normalized.setdefault("fio_ok", normalized.get("fio_ok"))
+        normalized.setdefault("mapping_hint", normalized.get("mapping_hint", ""))
+
+        missing_fields = [key for key in fieldnames if key not in normalized]
+        if missing_fields:
+            logger.warning("wipe_log: fehlende Felder ergänzt: %s", ", ".join(sorted(missing_fields)))
 
-    exists = os.path.exists(path)
-    with open(path, "a", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, delimiter=";", fieldnames=fieldnames)
-        if not exists:
-            writer.writeheader()
         sanitized = {}
         empty_fields = []
         for key in fieldnames:
@@ -117,6 +127,15 @@ def append_wipe_log(entry: Dict) -> None:
                 else:
                     sanitized_value = str(value).replace(";", "_")
                     sanitized[key] = sanitized_value
-        writer.writerow(sanitized)
-    if empty_fields:
-        logger.warning("wipe_log: leere Felder mit Platzhalter gefüllt: %s", ", ".join(sorted(empty_fields)))
+        if empty_fields:
+            logger.warning(
+                "wipe_log: leere Felder mit Platzhalter gefüllt: %s", ", ".join(sorted(empty_fields))
+            )
+        rows.append(sanitized)
+
+    exists = os.path.exists(path)
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, delimiter=";", fieldnames=fieldnames)
+        if not exists:
+            writer.writeheader()
+        writer.writerows(rows)
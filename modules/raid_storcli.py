@@ -13,12 +13,28 @@ logger = logging.getLogger("loeschstation")
 STORCLI_BIN = "storcli"
 
 
+class StorCLIError(RuntimeError):
+    """Basisklasse für StorCLI-Fehler; erlaubt isinstance-Dispatch in der UI."""
+
+
+class StorCLINotFoundError(StorCLIError):
+    """Das storcli-Binary ist nicht installiert bzw. nicht im PATH."""
+
+
+class StorCLISudoError(StorCLIError):
+    """Sudo-Passwort fehlt oder die Authentifizierung schlug fehl."""
+
+
+class StorCLIJBODUnsupportedError(StorCLIError):
+    """Der Controller unterstützt das JBOD-Kommando nicht (oder es ist gesetzt)."""
+
+
 def _run_storcli_json(args: List[str]) -> Dict:
     """Führt StorCLI mit sudo aus und liefert das JSON-Ergebnis."""
 
     pw = config_manager.get_sudo_password()
     if not pw:
-        raise RuntimeError("sudo-Passwort nicht konfiguriert")
+        raise StorCLISudoError("sudo-Passwort nicht konfiguriert")
 
     cmd = ["sudo", "-S", STORCLI_BIN] + list(args)
     proc = subprocess.run(
@@ -40,12 +56,12 @@ def _run_storcli_json(args: List[str]) -> Dict:
             data = {}
 
         if "command invalid" in lower_err or _is_jbod_command_invalid(data):
-            raise RuntimeError("storcli-jbod-unsupported")
+            raise StorCLIJBODUnsupportedError("storcli-jbod-unsupported")
         if "Authentication failed" in stderr:
-            raise RuntimeError("sudo-Authentifizierung fehlgeschlagen")
+            raise StorCLISudoError("sudo-Authentifizierung fehlgeschlagen")
         if "command not found" in stderr or "No such file" in stderr:
-            raise RuntimeError("storcli-Binary nicht gefunden")
-        raise RuntimeError(f"StorCLI fehlgeschlagen: {stderr}")
+            raise StorCLINotFoundError("storcli-Binary nicht gefunden")
+        raise StorCLIError(f"StorCLI fehlgeschlagen: {stderr}")
 
     return json.loads(stdout or "{}")
 
@@ -78,12 +94,68 @@ def list_controllers() -> List[Dict]:
 def list_physical_drives(controller_id: int) -> List[Dict]:
     data = _run_storcli_json([f"/c{controller_id}", "show", "all", "J"])
     detail_map = _collect_pd_details(controller_id)
-    drives: List[Dict] = []
     controllers = data.get("Controllers", []) or []
     if not controllers:
-        return drives
+        return []
 
     resp = (controllers[0] or {}).get("Response Data", {}) or {}
+    return _parse_pd_list(controller_id, resp, detail_map)
+
+
+def list_all_physical_drives() -> Dict[int, List[Dict]]:
+    """
+    Liest die Physical-Drive-Übersicht aller Controller auf einmal.
+
+    Statt pro Controller zwei StorCLI-Aufrufe abzusetzen, werden genau zwei
+    /call-Aufrufe gemacht (Übersicht + Details) und die Antwortblöcke in
+    Python nach Controller-ID partitioniert. Rückgabe ist ein Dict
+    Controller-ID -> Drive-Liste wie von list_physical_drives().
+    """
+
+    data = _run_storcli_json(["/call", "show", "all", "J"])
+
+    detail_maps: Dict[int, Dict[Tuple[Optional[int], Optional[int]], Dict[str, str]]] = {}
+    try:
+        detail_data = _run_storcli_json(["/call", "/eall", "/sall", "show", "all", "J"])
+    except Exception:
+        detail_data = {}
+    for ctrl in detail_data.get("Controllers", []) or []:
+        cid = _controller_id_from_block(ctrl)
+        if cid is None:
+            continue
+        resp = (ctrl or {}).get("Response Data", {}) or {}
+        detail_maps[cid] = _pd_details_from_response(cid, resp)
+
+    drives: Dict[int, List[Dict]] = {}
+    for ctrl in data.get("Controllers", []) or []:
+        cid = _controller_id_from_block(ctrl)
+        if cid is None:
+            continue
+        resp = (ctrl or {}).get("Response Data", {}) or {}
+        drives[cid] = _parse_pd_list(cid, resp, detail_maps.get(cid, {}))
+    return drives
+
+
+def _controller_id_from_block(ctrl: Dict) -> Optional[int]:
+    """Ermittelt die Controller-ID eines Antwortblocks aus einem /call-Aufruf."""
+
+    status = (ctrl or {}).get("Command Status", {}) or {}
+    cid = _safe_int(status.get("Controller"))
+    if cid is None:
+        resp = (ctrl or {}).get("Response Data", {}) or {}
+        basics = resp.get("Basics", {}) or {}
+        cid = _safe_int(basics.get("Controller"))
+    return cid
+
+
+def _parse_pd_list(
+    controller_id: int,
+    resp: Dict,
+    detail_map: Dict[Tuple[Optional[int], Optional[int]], Dict[str, str]],
+) -> List[Dict]:
+    """Baut aus dem Response-Data-Block eines Controllers die Drive-Liste."""
+
+    drives: List[Dict] = []
     pd_list = resp.get("PD LIST", []) or []
     for entry in pd_list:
         eid_slt = entry.get("EID:Slt") or entry.get("EID/Slt") or ""
@@ -184,17 +256,25 @@ def _collect_pd_details(
     mappt Seriennummer und Modell auf (EID, Slot).
     """
 
-    details: Dict[Tuple[Optional[int], Optional[int]], Dict[str, str]] = {}
     try:
         data = _run_storcli_json([f"/c{controller_id}", "/eall", "/sall", "show", "all", "J"])
     except Exception:
-        return details
+        return {}
 
     controllers = data.get("Controllers", []) or []
     if not controllers:
-        return details
+        return {}
 
     resp = (controllers[0] or {}).get("Response Data", {}) or {}
+    return _pd_details_from_response(controller_id, resp)
+
+
+def _pd_details_from_response(
+    controller_id: int, resp: Dict
+) -> Dict[Tuple[Optional[int], Optional[int]], Dict[str, str]]:
+    """Scannt einen Response-Data-Block rekursiv nach PD-Details."""
+
+    details: Dict[Tuple[Optional[int], Optional[int]], Dict[str, str]] = {}
 
     def _store_detail(
         eid: Optional[int], slot: Optional[int], serial: str, model: str, os_path: str
@@ -378,13 +458,11 @@ def set_all_drives_to_jbod(controller_id: Optional[int] = None) -> None:
             continue
         try:
             _run_storcli_json([f"/c{cid}", "/eall", "/sall", "set", "jbod"])
-        except RuntimeError as exc:
-            if str(exc) == "storcli-jbod-unsupported":
-                logger.info(
-                    "JBOD auf Controller %s nicht unterstützt oder bereits gesetzt", cid
-                )
-                continue
-            raise
+        except StorCLIJBODUnsupportedError:
+            logger.info(
+                "JBOD auf Controller %s nicht unterstützt oder bereits gesetzt", cid
+            )
+            continue
 
 
 def _get_pd_details(controller_id: int, eid: int, slot: int) -> Dict[str, str]:
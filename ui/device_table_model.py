@@ -0,0 +1,148 @@
+"""Model/View-Backend der Gerätetabelle.
+
+Hält die Geräteliste des Hauptfensters direkt als Modelldaten, statt pro
+Reload tausende QTableWidgetItems samt String-Konvertierungen anzulegen.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+# Spaltenreihenfolge – muss zu COLUMN_LABELS passen
+COLUMN_KEYS = (
+    "bay",
+    "path",
+    "size",
+    "model",
+    "serial",
+    "transport",
+    "mapping_hint",
+    "fio_bw",
+    "fio_iops",
+    "fio_lat",
+    "fio_ok",
+    "erase_method",
+    "erase_tool",
+    "erase_standard",
+    "start_timestamp",
+    "end_timestamp",
+    "erase_ok",
+)
+
+COLUMN_LABELS = (
+    "Bay",
+    "Pfad",
+    "Größe",
+    "Modell",
+    "Seriennummer",
+    "Transport",
+    "Mapping",
+    "FIO MB/s",
+    "FIO IOPS",
+    "FIO Latenz",
+    "FIO OK",
+    "Erase Methode",
+    "Erase Tool",
+    "Löschstandard",
+    "Startzeit",
+    "Endzeit",
+    "Erase OK",
+)
+
+COLUMN_INDEX = {key: idx for idx, key in enumerate(COLUMN_KEYS)}
+
+
+def _fmt_default(value) -> str:
+    return "–" if value in (None, "") else str(value)
+
+
+def _fmt_bool(value) -> str:
+    if value is None:
+        return "–"
+    return "OK" if value else "Fehler"
+
+
+def _fmt_float2(value) -> str:
+    return f"{value:.2f}" if isinstance(value, float) else _fmt_default(value)
+
+
+def _fmt_float3(value) -> str:
+    return f"{value:.3f}" if isinstance(value, float) else _fmt_default(value)
+
+
+# Dispatch statt isinstance-Kette: ein Dict-Lookup + ein Call pro Zelle
+_FORMATTERS = {
+    "fio_ok": _fmt_bool,
+    "erase_ok": _fmt_bool,
+    "fio_bw": _fmt_float2,
+    "fio_iops": _fmt_float2,
+    "fio_lat": _fmt_float3,
+}
+
+
+def format_cell(dev: Dict, key: str) -> str:
+    """Formatiert einen Gerätewert für die Tabellenanzeige."""
+
+    value = dev.get(key, "")
+    if key == "erase_standard" and not value:
+        value = dev.get("erase_method", "")
+    return _FORMATTERS.get(key, _fmt_default)(value)
+
+
+class DeviceTableModel(QAbstractTableModel):
+    """Read-only-Modell über der Geräteliste des Hauptfensters."""
+
+    def __init__(self, devices: Optional[List[Dict]] = None, parent=None):
+        super().__init__(parent)
+        self._devices: List[Dict] = devices if devices is not None else []
+
+    # --- Qt-Modellschnittstelle ------------------------------------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._devices)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMN_KEYS)
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            if 0 <= section < len(COLUMN_LABELS):
+                return COLUMN_LABELS[section]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        return format_cell(self._devices[index.row()], COLUMN_KEYS[index.column()])
+
+    # --- Zugriff aus dem Hauptfenster ------------------------------------
+    def device_at(self, row: int) -> Optional[Dict]:
+        if 0 <= row < len(self._devices):
+            return self._devices[row]
+        return None
+
+    def set_devices(self, devices: List[Dict]) -> None:
+        """Ersetzt die Geräteliste in einem Modell-Reset.
+
+        Liefert ein Reload inhaltlich identische Daten, wird nur die
+        Referenz übernommen – kein Reset, keine Neuzeichnung und kein
+        Verlust von Selektion/Scrollposition.
+        """
+
+        if devices == self._devices:
+            self._devices = devices
+            return
+        self.beginResetModel()
+        self._devices = devices
+        self.endResetModel()
+
+    def refresh_cells(self, row: int, keys: Iterable[str]) -> None:
+        """Meldet nur die von `keys` betroffenen Zellen einer Zeile als geändert."""
+
+        if not (0 <= row < len(self._devices)):
+            return
+        cols = sorted(COLUMN_INDEX[key] for key in keys if key in COLUMN_INDEX)
+        if not cols:
+            return
+        self.dataChanged.emit(
+            self.index(row, cols[0]), self.index(row, cols[-1]), [Qt.DisplayRole]
+        )
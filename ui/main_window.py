@@ -1,12 +1,31 @@
+import base64
+import collections
+import functools
 import json
+import logging
 import os
-import subprocess
+import queue
 import sys
+import tempfile
+import threading
 from datetime import datetime
 from typing import List, Dict
 
-from PySide6.QtCore import Qt, QByteArray, QEvent, QSize
-from PySide6.QtGui import QIcon, QMovie
+from PySide6.QtCore import (
+    Qt,
+    QByteArray,
+    QEvent,
+    QObject,
+    QProcess,
+    QRunnable,
+    QSize,
+    QSortFilterProxyModel,
+    QThreadPool,
+    QUrl,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QDesktopServices, QIcon, QMovie, QTextCursor
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -15,14 +34,15 @@ from PySide6.QtWidgets import (
     QPushButton,
     QComboBox,
     QLabel,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QAbstractItemView,
     QHeaderView,
     QSplitter,
     QTextEdit,
     QGroupBox,
     QGridLayout,
+    QDialog,
+    QPlainTextEdit,
     QInputDialog,
     QMessageBox,
     QFrame,
@@ -34,6 +54,8 @@ CERT_MODULE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..",
 if CERT_MODULE_DIR not in sys.path:
     sys.path.insert(0, CERT_MODULE_DIR)
 
+_CERT_GUI_SCRIPT = os.path.join(CERT_MODULE_DIR, "export_certificates_gui.py")
+
 import export_certificates as cert_core
 
 from modules import (
@@ -48,17 +70,222 @@ from modules import (
 )
 from modules import config_manager
 from modules.config_manager import load_config, save_config
-from modules.logs import StatusLogger, append_wipe_log, setup_debug_logger
+from modules.logs import StatusLogger, append_wipe_logs, setup_debug_logger
 from modules.expert_mode import ExpertMode
 from modules import icons
+from ui.device_table_model import COLUMN_KEYS, COLUMN_LABELS, DeviceTableModel
 from ui.settings_window import SettingsWindow
 
+try:  # orjson ist optional und beschleunigt den Snapshot-Export deutlich
+    import orjson
+except ImportError:  # pragma: no cover - optionale Abhängigkeit
+    orjson = None
+
+
+class _DeviceJobSignals(QObject):
+    """Signal-Träger für Pool-Jobs – QRunnable selbst ist kein QObject.
+
+    Trägt zusätzlich die Buchführung des zugehörigen Batches (offene Jobs,
+    Ein-Dialog-Guard), damit parallel laufende Batches sich nicht
+    gegenseitig die Zähler überschreiben.
+    """
+
+    finished = Signal(object, object)  # Gerät, Runner-Ergebnis
+    failed = Signal(object, object)  # Gerät, Exception
+
+    def __init__(self, pending: int = 0):
+        super().__init__()
+        self.pending = pending
+        self.error_shown = False
+
+
+class _DeviceJob(QRunnable):
+    """Führt einen blockierenden Runner für genau ein Gerät im Threadpool aus."""
+
+    def __init__(self, device: Dict, fn, signals: _DeviceJobSignals):
+        super().__init__()
+        self._device = device
+        self._fn = fn
+        self._signals = signals
+
+    def run(self):  # pragma: no cover - läuft im Qt-Threadpool
+        try:
+            result = self._fn(self._device)
+        except Exception as exc:
+            self._signals.failed.emit(self._device, exc)
+        else:
+            self._signals.finished.emit(self._device, result)
+
+
+# Ergebnis-Felder, die beim Reload aus dem vorherigen Scan erhalten bleiben
+_PERSIST_KEYS = (
+    "fio_bw",
+    "fio_iops",
+    "fio_lat",
+    "fio_ok",
+    "erase_ok",
+    "erase_timestamp",
+    "erase_method",
+    "erase_standard",
+    "command",
+    "mapping_hint",
+)
+# Stammdaten, die ein neuer Scan gelegentlich leer liefert
+_FALLBACK_KEYS = ("model", "serial", "transport")
+
+
+def _dumps_json(obj) -> bytes:
+    """Serialisiert nach JSON-Bytes – orjson wenn vorhanden, sonst json."""
+
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _write_snapshot_file(snapshot_path: str, data: bytes, logger) -> None:
+    """Schreibt den fertig serialisierten Geräte-Snapshot atomar auf die Platte.
+
+    Läuft im Threadpool-Worker; tempfile + os.replace verhindern, dass
+    Leser jemals einen halb geschriebenen Snapshot sehen.
+    """
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(snapshot_path), suffix=".tmp"
+        )
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, snapshot_path)
+    except OSError as exc:  # pragma: no cover - defensive
+        logger.error("Geräteliste konnte nicht exportiert werden: %s", exc)
+
+
+class _ScanSignals(QObject):
+    """Signal-Träger für den Geräte-Scan im Threadpool."""
+
+    done = Signal(object)  # Liste der gescannten Geräte
+    failed = Signal(object)  # Exception
+
+
+class _ScanJob(QRunnable):
+    """Führt den blockierenden Geräte-Scan (lsblk/StorCLI) im Threadpool aus."""
+
+    def __init__(self, show_system: bool, signals: _ScanSignals):
+        super().__init__()
+        self._show_system = show_system
+        self._signals = signals
+
+    def run(self):  # pragma: no cover - läuft im Qt-Threadpool
+        try:
+            devices = device_scan.scan_all_devices(show_system_disks=self._show_system)
+        except Exception as exc:
+            self._signals.failed.emit(exc)
+        else:
+            self._signals.done.emit(devices)
+
+
+def _qba_to_b64(ba: QByteArray) -> str:
+    return base64.b64encode(bytes(ba)).decode("ascii")
+
+
+def _b64_to_qba(state: str) -> QByteArray:
+    return QByteArray.fromBase64(state.encode("ascii"))
+
+
+@functools.lru_cache(maxsize=16)
+def _state_to_qba(state: str) -> QByteArray:
+    """Dekodiert gespeicherte Zustands-Blobs (Geometry/Splitter/Header) nur einmal.
+
+    Ältere Konfigurationen speichern Hex, neuere Base64 – beides wird
+    akzeptiert, der Cache erspart das erneute Dekodieren bei wiederholten
+    Restore-Aufrufen.
+    """
+
+    try:
+        return QByteArray(bytes.fromhex(state))
+    except ValueError:
+        return QByteArray.fromBase64(state.encode("ascii"))
+
+
+@functools.lru_cache(maxsize=16)
+def _storcli_fallback_warning(message: str) -> str:
+    """Formatiert generische StorCLI-Fehler einmal pro Meldungstext.
+
+    Wer einen fehlschlagenden StorCLI-Button wiederholt klickt, erzeugt
+    sonst bei jedem Klick denselben String neu.
+    """
+
+    return f"StorCLI fehlgeschlagen: {message}"
+
+
+def per_device_action(label: str):
+    """Dekorator für einfache Pro-Gerät-Aktionen (SMART, NVMe, …).
+
+    Übernimmt Auswahl-Prüfung, Threadpool-Verteilung, Erfolgsmeldung und
+    Fehlerbehandlung, sodass die run_*-Methoden nur den eigentlichen
+    Aufruf pro Gerät enthalten. Jedes Gerät läuft als eigener Job – ein
+    fehlschlagendes Laufwerk bricht den Rest des Batches nicht ab.
+    """
+
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrap(self):
+            devices = self._ensure_devices_selected()
+            if not devices:
+                return
+
+            def job(dev: Dict):
+                fn(self, dev)
+                return dev
+
+            def on_finished(dev: Dict, _result) -> None:
+                self.status_logger.info(f"{label} gestartet für {dev['device']}")
+
+            def on_failed(dev: Dict, exc: Exception) -> None:
+                self._show_batch_error(exc)
+
+            self._submit_device_jobs(devices, job, on_finished, on_failed)
+
+        return wrap
+
+    return deco
+
+
+class JsonViewerDialog(QDialog):
+    """Nicht-modaler Viewer für große JSON-Dumps (StorCLI-Ausgaben).
+
+    QMessageBox layoutet den kompletten Text als Label und blockiert als
+    modaler Dialog das Hauptfenster; QPlainTextEdit rendert nur die
+    sichtbaren Zeilen und lässt das Fenster bedienbar.
+    """
+
+    def __init__(self, title: str, text: str, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.resize(720, 540)
+
+        layout = QVBoxLayout(self)
+        viewer = QPlainTextEdit(self)
+        viewer.setReadOnly(True)
+        viewer.setLineWrapMode(QPlainTextEdit.NoWrap)
+        viewer.setPlainText(text)
+        layout.addWidget(viewer)
+
+        btn_close = QPushButton("Schließen", self)
+        btn_close.clicked.connect(self.close)
+        layout.addWidget(btn_close, alignment=Qt.AlignRight)
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("FLS36 Tool Kit")
         self.resize(1300, 800)
+        # Icon-Lookups (Dateisystem/Theme) nur einmal pro Pfad ausführen
+        self._icon_cache: Dict[str, QIcon] = {}
+        # Standard-Icon der Tiles einmal auflösen statt pro Button
+        self._default_icon = self._load_icon(icons.ICON_DEFAULT)
         self.setWindowIcon(self._load_icon(icons.ICON_NWIPE))
 
         self.config = load_config()
@@ -69,6 +296,48 @@ class MainWindow(QMainWindow):
         self.expert_mode = ExpertMode(self.config, self._on_expert_change)
         self.secure_planner = secure_erase.SecureErasePlanner(False)
         self._settings_frame_connected = False
+        self._ui_dirty = False
+        self.settings_window: SettingsWindow | None = None
+        # Threadpool für blockierende Erase-/FIO-Läufe; hält die GUI flüssig
+        self._thread_pool = QThreadPool.globalInstance()
+        # Offene Jobs/Fehler-Guard liegen pro Batch am _DeviceJobSignals;
+        # hier nur die Zahl laufender Batches und der Dispatch-Kontext
+        self._running_batches = 0
+        self._dispatching_batch: _DeviceJobSignals | None = None
+        self._active_job_signals: set = set()
+        self._devices_changed = False
+        # device_id → Modellzeile; wird bei jedem Reload neu aufgebaut
+        self._device_index: Dict[str, int] = {}
+        # Pfad-basierte Lookups (z.B. ShredOS-Gerät) ohne lineare Suche
+        self._devices_by_path: Dict[str, Dict] = {}
+        self._devices_by_device: Dict[str, Dict] = {}
+        self._scan_in_flight = False
+        # Status-Zeilen puffern und alle 50 ms in einem Rutsch einfügen
+        self._status_queue: collections.deque = collections.deque(maxlen=10_000)
+        self._status_flush_timer = QTimer(self)
+        self._status_flush_timer.setSingleShot(True)
+        self._status_flush_timer.setInterval(50)
+        self._status_flush_timer.timeout.connect(self._flush_status)
+        # Pro Gerät zwischengespeicherte JSON-Fragmente (Fingerprint, Bytes)
+        self._json_frag_cache: Dict[str, tuple] = {}
+        # Snapshot-Export entkoppeln: 500 ms Debounce, Schreiben im Threadpool
+        self._snapshot_timer = QTimer(self)
+        self._snapshot_timer.setSingleShot(True)
+        self._snapshot_timer.timeout.connect(self._flush_snapshot)
+        # Hintergrund-Writer: bündelt wipe_log-Einträge statt pro Gerät open()/fsync
+        self._log_queue: queue.Queue = queue.Queue()
+        self._log_writer = threading.Thread(
+            target=self._log_writer_loop, name="wipe-log-writer", daemon=True
+        )
+        self._log_writer.start()
+        # Wiederverwendbarer Dialog statt Neuaufbau pro Warnung
+        self._unsupported_box = QMessageBox(
+            QMessageBox.Warning,
+            "Nicht unterstützt",
+            "Die gewählte Löschmethode wird vom ausgewählten Tool nicht unterstützt.",
+            QMessageBox.Ok,
+            self,
+        )
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -99,27 +368,13 @@ class MainWindow(QMainWindow):
         self.summary_bar = self._build_summary_bar()
         top_layout.addWidget(self.summary_bar)
 
-        self.device_table = QTableWidget()
-        self.device_table.setColumnCount(17)
-        self.device_table.setHorizontalHeaderLabels([
-            "Bay",
-            "Pfad",
-            "Größe",
-            "Modell",
-            "Seriennummer",
-            "Transport",
-            "Mapping",
-            "FIO MB/s",
-            "FIO IOPS",
-            "FIO Latenz",
-            "FIO OK",
-            "Erase Methode",
-            "Erase Tool",
-            "Löschstandard",
-            "Startzeit",
-            "Endzeit",
-            "Erase OK",
-        ])
+        # Model/View statt QTableWidget: keine Item-Allokationen pro Reload,
+        # Sortierung übernimmt der Proxy auf Modellebene
+        self.device_table = QTableView()
+        self._device_model = DeviceTableModel()
+        self._device_proxy = QSortFilterProxyModel(self)
+        self._device_proxy.setSourceModel(self._device_model)
+        self.device_table.setModel(self._device_proxy)
         self.device_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.device_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.device_table.setAlternatingRowColors(True)
@@ -129,6 +384,14 @@ class MainWindow(QMainWindow):
         header.setStretchLastSection(True)
         header.setSectionsMovable(True)
         header.setDragEnabled(True)
+        # Standardbreiten nur aus den Header-Metriken ableiten – erspart den
+        # Zellen-Scan von resizeColumnsToContents() nach jedem Reload
+        metrics = self.fontMetrics()
+        min_widths = {"path": 120, "model": 160, "serial": 140, "mapping_hint": 160}
+        self._default_col_widths = [
+            max(metrics.horizontalAdvance(label) + 32, min_widths.get(key, 0))
+            for key, label in zip(COLUMN_KEYS, COLUMN_LABELS)
+        ]
 
         btn_row = QHBoxLayout()
         self.btn_refresh = QPushButton("Aktualisieren")
@@ -172,17 +435,17 @@ class MainWindow(QMainWindow):
         self.bottom_splitter.addWidget(left_panel)
 
         right_panel = QWidget()
-        right_layout = QVBoxLayout()
-        right_layout.setSpacing(12)
-        right_layout.setContentsMargins(0, 0, 0, 0)
-        right_panel.setLayout(right_layout)
-
-        right_layout.addWidget(self._build_diagnostics_group())
-        right_layout.addWidget(self._build_wipe_group())
-        right_layout.addWidget(self._build_external_group())
-        self.raid_group = self._build_raid_group()
-        right_layout.addWidget(self.raid_group)
-        right_layout.addStretch()
+        self._right_layout = QVBoxLayout()
+        self._right_layout.setSpacing(12)
+        self._right_layout.setContentsMargins(0, 0, 0, 0)
+        right_panel.setLayout(self._right_layout)
+        self._right_layout.addStretch()
+
+        # Die Tile-Gruppen entstehen erst nach dem ersten Anzeigen
+        # (_build_side_groups); bis dahin bleibt die Sammlung leer
+        self._erase_buttons: tuple = ()
+        # Letzter Enabled-Zustand der Erase-Buttons; None = unbekannt
+        self._prev_action_state: bool | None = None
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -198,60 +461,112 @@ class MainWindow(QMainWindow):
         self.main_splitter.setStretchFactor(1, 1)
 
         self._restore_window_state()
+        self._connect_ui_state_tracking()
         self._update_expert_visibility()
 
         self.status_logger = StatusLogger(self._append_status)
-        try:
-            raid_storcli.set_all_drives_to_jbod()
-        except Exception as exc:  # pragma: no cover - defensive
-            self._handle_jbod_exception(exc)
-        self._reload_devices()
-        self.device_table.selectionModel().selectionChanged.connect(self._update_action_buttons)
+        self.devices: List[Dict] = []
+        # Schnelle Selektionswechsel zu einem Update pro Event-Loop-Durchlauf
+        # zusammenfassen statt pro selectionChanged-Signal neu zu rechnen
+        self._sel_timer = QTimer(self)
+        self._sel_timer.setSingleShot(True)
+        self._sel_timer.timeout.connect(self._update_action_buttons)
+        self.device_table.selectionModel().selectionChanged.connect(self._pending_sel_update)
         self._update_action_buttons()
+        # Rechte Tile-Gruppen nach dem ersten Anzeigen aufbauen: das Fenster
+        # erscheint sofort, die Icon-I/O folgt im nächsten Event-Loop-Durchlauf
+        QTimer.singleShot(0, self._build_side_groups)
+        # JBOD-Setup (subprocess) und Erst-Scan ebenfalls aus dem Konstruktor
+        # heraushalten – das Fenster malt zuerst, der Scan folgt im Idle-Tick
+        self.status_label.setText("Geräte werden gescannt…")
+        QTimer.singleShot(0, self._post_show_init)
+
+    def _post_show_init(self) -> None:
+        """Führt JBOD-Setup und Erst-Scan nach dem ersten Anzeigen aus."""
+
+        self._refresh_with_jbod()
+        self._update_action_buttons()
+
+    def _build_side_groups(self) -> None:
+        """Baut die rechten Tile-Gruppen verzögert nach dem ersten Anzeigen."""
+
+        layout = self._right_layout
+        layout.insertWidget(0, self._build_diagnostics_group())
+        layout.insertWidget(1, self._build_wipe_group())
+        layout.insertWidget(2, self._build_external_group())
+        self.raid_group = self._build_raid_group()
+        layout.insertWidget(3, self.raid_group)
+
+        # Buttons existieren ab hier für die Lebensdauer des Fensters –
+        # einmal einsammeln statt getattr pro Selektionswechsel
+        self._erase_buttons = (self.btn_nwipe, self.btn_secure, self.btn_fio, self.btn_badblocks)
+        self._prev_action_state = None
+        self._update_expert_visibility()
 
     def _load_icon(self, path: str) -> QIcon:
-        """Lädt Icons aus Dateien oder Symbol-Themes."""
+        """Lädt Icons aus Dateien oder Symbol-Themes (memoisiert)."""
+
+        cached = self._icon_cache.get(path)
+        if cached is not None:
+            return cached
 
+        icon = None
         if path and (path.endswith(".svg") or os.path.sep in path):
             abs_path = path
             if not os.path.isabs(path):
                 abs_path = os.path.join(os.path.dirname(__file__), "..", path)
             if os.path.exists(abs_path):
-                return QIcon(abs_path)
+                icon = QIcon(abs_path)
 
-        icon = QIcon.fromTheme(path)
-        if not icon.isNull():
-            return icon
-
-        return QIcon.fromTheme("drive-harddisk")
+        if icon is None:
+            icon = QIcon.fromTheme(path)
+            if icon.isNull():
+                icon = QIcon.fromTheme("drive-harddisk")
+        self._icon_cache[path] = icon
+        return icon
 
     def eventFilter(self, obj, event):
         if obj is self.btn_settings:
             if event.type() == QEvent.Enter:
                 self.settings_movie.start()
-                self.btn_settings.setIcon(QIcon(self.settings_movie.currentPixmap()))
+                self.btn_settings.setIcon(self._settings_movie_icon())
                 if not self._settings_frame_connected:
                     self.settings_movie.frameChanged.connect(
-                        lambda: self.btn_settings.setIcon(QIcon(self.settings_movie.currentPixmap()))
+                        lambda: self.btn_settings.setIcon(self._settings_movie_icon())
                     )
                     self._settings_frame_connected = True
             elif event.type() == QEvent.Leave:
                 self.settings_movie.stop()
                 self.settings_movie.jumpToFrame(0)
-                self.btn_settings.setIcon(QIcon(self.settings_movie.currentPixmap()))
+                self.btn_settings.setIcon(self._settings_movie_icon())
         return super().eventFilter(obj, event)
 
+    def _settings_movie_icon(self) -> QIcon:
+        """Liefert das QIcon zum aktuellen GIF-Frame aus dem Cache.
+
+        Erspart das Pixmap→QIcon-Konvertieren pro Frame bei jedem Hover –
+        das GIF hat nur eine Handvoll Frames, die sich ständig wiederholen.
+        """
+
+        frame = self.settings_movie.currentFrameNumber()
+        icon = self._settings_frame_icons.get(frame)
+        if icon is None:
+            icon = QIcon(self.settings_movie.currentPixmap())
+            self._settings_frame_icons[frame] = icon
+        return icon
+
     def _build_settings_button(self) -> QToolButton:
         btn = QToolButton()
         gif_path = os.path.join(os.path.dirname(__file__), "..", "img", "settings_gear.gif")
         self.settings_movie = QMovie(gif_path)
         self.settings_movie.setScaledSize(QSize(32, 32))
         self.settings_movie.jumpToFrame(0)
-        btn.setIcon(QIcon(self.settings_movie.currentPixmap()))
+        self._settings_frame_icons: Dict[int, QIcon] = {}
+        btn.setIcon(self._settings_movie_icon())
         btn.setToolTip("Einstellungen")
         btn.setAutoRaise(True)
         btn.setToolButtonStyle(Qt.ToolButtonIconOnly)
-        btn.setStyleSheet("QToolButton { border: none; padding: 2px; margin: 0; }")
+        btn.setObjectName("settingsButton")
         btn.setIconSize(QSize(32, 32))
         btn.clicked.connect(self.open_settings)
         btn.installEventFilter(self)
@@ -260,11 +575,8 @@ class MainWindow(QMainWindow):
     def _create_tile_button(self, text: str, func, icon_path: str | None = None) -> QPushButton:
         btn = QPushButton(text)
         btn.setMinimumHeight(60)
-        btn.setIcon(self._load_icon(icon_path or icons.ICON_DEFAULT))
-        btn.setStyleSheet(
-            "padding: 10px; border-radius: 4px; font-weight: 500;"
-            "border: 1px solid #c0c0c0;"
-        )
+        btn.setIcon(self._load_icon(icon_path) if icon_path else self._default_icon)
+        btn.setObjectName("tile")
         btn.clicked.connect(func)
         return btn
 
@@ -279,6 +591,9 @@ class MainWindow(QMainWindow):
         frame.setLayout(layout)
 
         self.summary_labels: Dict[str, QLabel] = {}
+        # Formatvorlagen und letzter Stand: setText nur bei echten Änderungen
+        self._summary_fmt: Dict[str, str] = {}
+        self._last_totals: Dict[str, int] = {}
         for key, title in [
             ("total", "Gesamt"),
             ("tested_ok", "Getestet OK"),
@@ -286,12 +601,9 @@ class MainWindow(QMainWindow):
             ("errors", "Fehler"),
             ("not_tested", "Ohne Test"),
         ]:
+            self._summary_fmt[key] = f"{title}: {{}}"
             label = QLabel(f"{title}: –")
-            label.setStyleSheet(
-                "padding: 8px 12px; border: 1px solid #c7ccd3;"
-                "border-radius: 4px; background-color: #e8ecf1;"
-                "font-weight: 600;"
-            )
+            label.setObjectName("summary")
             self.summary_labels[key] = label
             layout.addWidget(label)
 
@@ -347,24 +659,26 @@ class MainWindow(QMainWindow):
             "badblocks": [("Zero Fill / 1-Pass", "zero-fill")],
         }
 
+        # Reverse-Map Standard → unterstützende Tools, einmal aufgebaut für
+        # O(1)-Guards in _validate_tool_standard und den _run_*-Methoden
+        reverse: Dict[str, set] = {}
+        for tool, options in self._standard_options.items():
+            for _, value in options:
+                reverse.setdefault(value, set()).add(tool)
+        self._standard_to_tools = {key: frozenset(tools) for key, tools in reverse.items()}
+
         self.erase_tool_combo = QComboBox()
         self.erase_tool_combo.addItem("Nwipe", "nwipe")
         self.erase_tool_combo.addItem("Secure Erase (ATA / NVMe)", "secure")
         self.erase_tool_combo.addItem("Badblocks Destructive", "badblocks")
         self.erase_tool_combo.setMinimumHeight(38)
-        self.erase_tool_combo.setStyleSheet(
-            "QComboBox { padding: 6px 10px; font-weight: 600; }"
-            "QComboBox::drop-down { width: 24px; }"
-        )
+        self.erase_tool_combo.setObjectName("eraseCombo")
 
         self.erase_tool_combo.currentIndexChanged.connect(self._sync_erase_standard_options)
 
         self.erase_standard_combo = QComboBox()
         self.erase_standard_combo.setMinimumHeight(38)
-        self.erase_standard_combo.setStyleSheet(
-            "QComboBox { padding: 6px 10px; font-weight: 600; }"
-            "QComboBox::drop-down { width: 24px; }"
-        )
+        self.erase_standard_combo.setObjectName("eraseCombo")
         self._sync_erase_standard_options()
 
         combo_row = QHBoxLayout()
@@ -410,52 +724,90 @@ class MainWindow(QMainWindow):
         return box
 
     def _append_status(self, text: str) -> None:
-        self.status_log.append(text)
-        self.debug_logger.info(text)
+        # Status-Zeilen sammeln und gebündelt einfügen: ein Relayout pro
+        # Burst statt pro append() (relevant bei Multi-Device-Läufen)
+        self._status_queue.append(text)
+        # Bei stummem Handler (NullHandler/WARNING) gar nicht erst formatieren
+        if self.debug_logger.isEnabledFor(logging.INFO):
+            self.debug_logger.info(text)
+        if not self._status_flush_timer.isActive():
+            self._status_flush_timer.start()
+
+    def _flush_status(self) -> None:
+        if not self._status_queue:
+            return
+        # Der abgekoppelte Cursor scrollt nicht mit – das Folgeverhalten von
+        # append() von Hand nachbilden: stand die Ansicht unten, bleibt sie unten
+        scrollbar = self.status_log.verticalScrollBar()
+        was_at_bottom = scrollbar.value() >= scrollbar.maximum()
+        cursor = self.status_log.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText("\n".join(self._status_queue) + "\n")
+        self._status_queue.clear()
+        if was_at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
 
     def _update_summary(self) -> None:
         """Aktualisiert die Kennzahlen über der Gerätetabelle."""
 
         labels = getattr(self, "summary_labels", {})
         devices = getattr(self, "devices", []) or []
+        tested_ok = tested_only = errors = not_tested = 0
+        for d in devices:
+            fio = d.get("fio_ok")
+            erase = d.get("erase_ok")
+            tested_ok += fio is True and erase is True
+            tested_only += fio is not None and erase is None
+            errors += fio is False or erase is False
+            not_tested += fio is None and erase is None
         totals = {
             "total": len(devices),
-            "tested_ok": sum(
-                1 for d in devices if d.get("fio_ok") is True and d.get("erase_ok") is True
-            ),
-            "tested_only": sum(
-                1 for d in devices if d.get("fio_ok") is not None and d.get("erase_ok") is None
-            ),
-            "errors": sum(1 for d in devices if d.get("fio_ok") is False or d.get("erase_ok") is False),
-            "not_tested": sum(
-                1 for d in devices if d.get("fio_ok") is None and d.get("erase_ok") is None
-            ),
-        }
-        titles = {
-            "total": "Gesamt",
-            "tested_ok": "Getestet OK",
-            "tested_only": "Nur getestet",
-            "errors": "Fehler",
-            "not_tested": "Ohne Test",
+            "tested_ok": tested_ok,
+            "tested_only": tested_only,
+            "errors": errors,
+            "not_tested": not_tested,
         }
+        last = self._last_totals
         for key, label in labels.items():
-            label.setText(f"{titles.get(key, key)}: {totals.get(key, 0)}")
+            value = totals.get(key, 0)
+            if last.get(key) != value:
+                label.setText(self._summary_fmt[key].format(value))
+        self._last_totals = totals
 
     def append_status(self, text: str) -> None:
         self._append_status(text)
 
     def _export_device_snapshot(self) -> None:
+        """Stößt den Snapshot-Export an (gebündelt über den Debounce-Timer)."""
+
+        self._snapshot_timer.start(500)
+
+    def _flush_snapshot(self) -> None:
         """Exportiert die aktuellen Gerätedaten für Zertifikate/Prüfungen."""
 
         log_dir = config_manager.get_log_dir(self.config)
         snapshot_path = os.path.join(log_dir, "devices_snapshot.json")
         os.makedirs(log_dir, exist_ok=True)
-        devices: List[Dict] = []
+        now = datetime.now()
+        fallback_timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
+        cache = self._json_frag_cache
+        frags: List[bytes] = []
+        seen = set()
         for dev in self.devices:
+            dev_id = dev.get("device_id") or dev.get("path") or dev.get("device")
+            seen.add(dev_id)
+            # Unveränderte Geräte: fertiges JSON-Fragment wiederverwenden
+            fingerprint = hash(repr(sorted(dev.items())))
+            cached = cache.get(dev_id)
+            if cached is not None and cached[0] == fingerprint:
+                frags.append(cached[1])
+                continue
             snap = dev.copy()
+            # Interner Cache-Schlüssel, gehört nicht in den Export
+            snap.pop("_target", None)
             timestamp = snap.get("erase_timestamp") or snap.get("timestamp")
             if not timestamp:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                timestamp = fallback_timestamp
             snap.setdefault("timestamp", timestamp)
             snap.setdefault("start_timestamp", snap.get("start_timestamp") or snap.get("timestamp") or timestamp)
             snap.setdefault("end_timestamp", snap.get("end_timestamp") or snap.get("erase_timestamp") or timestamp)
@@ -472,29 +824,41 @@ class MainWindow(QMainWindow):
             snap.setdefault("size", snap.get("size") or "")
             snap.setdefault("path", snap.get("path") or snap.get("device") or "")
             snap.setdefault("bay", snap.get("bay") or snap.get("device") or snap.get("path") or "")
-            devices.append(snap)
-
-        payload = {"exported_at": datetime.now().isoformat(), "devices": devices}
-        try:
-            with open(snapshot_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2, ensure_ascii=False)
-        except OSError as exc:  # pragma: no cover - defensive
-            self.debug_logger.error("Geräteliste konnte nicht exportiert werden: %s", exc)
+            frag = _dumps_json(snap)
+            cache[dev_id] = (fingerprint, frag)
+            frags.append(frag)
+
+        # Fragmente verschwundener Geräte nicht weiter vorhalten
+        for dev_id in [key for key in cache if key not in seen]:
+            del cache[dev_id]
+
+        data = (
+            b'{"exported_at": '
+            + _dumps_json(now.isoformat())
+            + b', "devices": ['
+            + b", ".join(frags)
+            + b"]}"
+        )
+        logger = self.debug_logger
+        self._thread_pool.start(
+            lambda: _write_snapshot_file(snapshot_path, data, logger)
+        )
 
     # --- Logging der Testergebnisse / Löschvorgänge -----------------------
     def _log_device_event(self, device: Dict, data: Dict) -> None:
         # PATCH-5: unify & repair timestamps
+        fallback_ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         start_ts = (
             data.get("start_timestamp")
             or device.get("start_timestamp")
-            or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            or fallback_ts
         )
 
         end_ts = (
             data.get("end_timestamp")
             or data.get("erase_timestamp")
             or data.get("timestamp")
-            or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            or fallback_ts
         )
 
         # Guarantee final timestamp
@@ -533,12 +897,25 @@ class MainWindow(QMainWindow):
                 "fio_ok": entry.get("fio_ok"),
             }
         )
-        try:
-            append_wipe_log(entry)
-        except Exception as exc:  # pragma: no cover - defensive
-            self.debug_logger.error("Log-Eintrag fehlgeschlagen: %s", exc)
+        self._log_queue.put(entry)
         self._maybe_generate_certificate(entry)
 
+    def _log_writer_loop(self) -> None:  # pragma: no cover - läuft im Daemon-Thread
+        while True:
+            batch = [self._log_queue.get()]
+            try:
+                while True:
+                    batch.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                pass
+            try:
+                append_wipe_logs(batch)
+            except Exception as exc:  # pragma: no cover - defensive
+                self.debug_logger.error("Log-Eintrag fehlgeschlagen: %s", exc)
+            finally:
+                for _ in batch:
+                    self._log_queue.task_done()
+
     def _maybe_generate_certificate(self, entry: Dict) -> None:
         auto_enabled = self.config.get("auto_generate_certificates", True)
         erase_state = entry.get("erase_ok")
@@ -556,8 +933,26 @@ class MainWindow(QMainWindow):
             self.debug_logger.error("Zertifikatserzeugung fehlgeschlagen: %s", exc)
 
     def _reload_devices(self):
+        # Scan läuft im Threadpool; Mehrfachklicks während eines laufenden
+        # Scans fallen zu einem Durchlauf zusammen
+        if self._scan_in_flight:
+            return
+        self._scan_in_flight = True
+        self.btn_refresh.setEnabled(False)
         show_system = self.config.get("show_system_disks", False) or self.expert_mode.enabled
-        scanned = device_scan.scan_all_devices(show_system_disks=show_system)
+        signals = _ScanSignals()
+        # Referenz halten, sonst räumt Python die Signal-Quelle vorzeitig ab
+        self._active_job_signals.add(signals)
+        signals.done.connect(lambda scanned, s=signals: self._on_scan_done(scanned, s))
+        signals.failed.connect(lambda exc, s=signals: self._on_scan_failed(exc, s))
+        self._thread_pool.start(_ScanJob(show_system, signals))
+
+    def _on_scan_done(self, scanned: List[Dict], signals) -> None:
+        """Übernimmt das Scan-Ergebnis im GUI-Thread in Tabelle und Caches."""
+
+        self._active_job_signals.discard(signals)
+        self._scan_in_flight = False
+        self.btn_refresh.setEnabled(True)
         previous = {d.get("device_id") or d.get("path"): d for d in getattr(self, "devices", [])}
         devices: List[Dict] = []
         for dev in scanned:
@@ -583,91 +978,90 @@ class MainWindow(QMainWindow):
             # Vorherige Testergebnisse beibehalten, damit FIO/Erase nach Reload sichtbar bleiben
             previous_entry = previous.get(normalized["device_id"])
             if previous_entry:
-                for key in (
-                    "fio_bw",
-                    "fio_iops",
-                    "fio_lat",
-                    "fio_ok",
-                    "erase_ok",
-                    "erase_timestamp",
-                    "erase_method",
-                    "erase_standard",
-                    "command",
-                    "mapping_hint",
-                ):
-                    if key in previous_entry and (normalized.get(key) is None or normalized.get(key) == ""):
-                        normalized[key] = previous_entry.get(key)
-
-                for key in ("model", "serial", "transport"):
-                    if not normalized.get(key) and previous_entry.get(key):
-                        normalized[key] = previous_entry.get(key)
+                p_get = previous_entry.get
+                n_get = normalized.get
+                for key in _PERSIST_KEYS:
+                    if key in previous_entry and n_get(key) in (None, ""):
+                        normalized[key] = p_get(key)
+
+                for key in _FALLBACK_KEYS:
+                    if not n_get(key) and p_get(key):
+                        normalized[key] = p_get(key)
+
+            # Ziel-Pfad einmal beim Merge auflösen statt in jedem run_*-Aufruf
+            normalized["_target"] = (
+                normalized.get("target") or normalized.get("path") or normalized.get("device")
+            )
 
             devices.append(normalized)
 
         self.devices = devices
+        self._device_index = {d.get("device_id"): i for i, d in enumerate(devices)}
+        self._devices_by_path = {d["path"]: d for d in devices if d.get("path")}
+        self._devices_by_device = {d["device"]: d for d in devices if d.get("device")}
         self._populate_table()
-        widths = self.config.get("table_column_widths") or []
+        widths = self._configured_column_widths()
         if widths:
             for idx, width in enumerate(widths):
-                if idx < self.device_table.columnCount() and width:
+                if idx < self._device_proxy.columnCount() and width:
                     self.device_table.setColumnWidth(idx, width)
         else:
-            self.device_table.resizeColumnsToContents()
-        header = self.device_table.horizontalHeader()
-        self.device_table.sortItems(header.sortIndicatorSection(), header.sortIndicatorOrder())
+            for idx, width in enumerate(self._default_col_widths):
+                self.device_table.setColumnWidth(idx, width)
         self.status_label.setText(device_scan.get_last_warning())
         self.status_logger.info(f"{len(devices)} Laufwerke geladen")
         self._update_action_buttons()
 
+    def _on_scan_failed(self, exc: Exception, signals) -> None:
+        self._active_job_signals.discard(signals)
+        self._scan_in_flight = False
+        self.btn_refresh.setEnabled(True)
+        self.status_logger.error(f"Geräte-Scan fehlgeschlagen: {exc}")
+        self.debug_logger.error("Geräte-Scan fehlgeschlagen: %s", exc)
+
     def _populate_table(self) -> None:
-        self.device_table.setRowCount(0)
-        for row, dev in enumerate(self.devices):
-            self.device_table.insertRow(row)
-            for col, key in enumerate(
-                [
-                    "bay",
-                    "path",
-                    "size",
-                    "model",
-                    "serial",
-                    "transport",
-                    "mapping_hint",
-                    "fio_bw",
-                    "fio_iops",
-                    "fio_lat",
-                    "fio_ok",
-                    "erase_method",
-                    "erase_tool",
-                    "erase_standard",
-                    "start_timestamp",
-                    "end_timestamp",
-                    "erase_ok",
-                ]
-            ):
-                value = dev.get(key, "")
-                if key == "erase_standard" and not value:
-                    value = dev.get("erase_method", "")
-                if isinstance(value, bool):
-                    display = "OK" if value else "Fehler"
-                elif isinstance(value, float):
-                    display = f"{value:.3f}" if key == "fio_lat" else f"{value:.2f}"
-                else:
-                    display = "–" if value in (None, "") else str(value)
-                item = QTableWidgetItem(display)
-                if col == 0:
-                    item.setData(Qt.UserRole, dev)
-                self.device_table.setItem(row, col, item)
+        # Dynamische Proxy-Sortierung während des Resets pausieren:
+        # eine Sortierung nach dem Reset statt pro Änderungssignal
+        self._device_proxy.setDynamicSortFilter(False)
+        self._device_model.set_devices(self.devices)
+        self._device_proxy.setDynamicSortFilter(True)
+        header = self.device_table.horizontalHeader()
+        self._device_proxy.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
         self._export_device_snapshot()
         self._update_summary()
 
-    def _apply_device_updates(self, device: Dict, updates: Dict) -> None:
-        """Schreibt Testergebnisse in self.devices anhand der device_id."""
+    def _apply_device_updates(self, device: Dict, updates: Dict) -> int:
+        """Schreibt Testergebnisse in self.devices anhand der device_id.
+
+        Meldet nur die betroffenen Zellen als geändert und liefert die
+        mutierte Modellzeile (oder -1), damit Aufrufer gezielt nacharbeiten
+        können statt die Tabelle neu aufzubauen.
+        """
 
         device_id = device.get("device_id") or device.get("path") or device.get("device")
-        for dev in self.devices:
-            if dev.get("device_id") == device_id:
-                dev.update(updates)
-                return
+        row = self._device_row_index(device_id)
+        if row < 0:
+            return -1
+        self.devices[row].update(updates)
+        if "target" in updates:
+            entry = self.devices[row]
+            entry["_target"] = (
+                entry.get("target") or entry.get("path") or entry.get("device")
+            )
+        if updates:
+            affected = set(updates)
+            if "erase_method" in affected:
+                # Anzeige von erase_standard fällt auf erase_method zurück
+                affected.add("erase_standard")
+            self._device_model.refresh_cells(row, affected)
+            self._devices_changed = True
+        return row
+
+    def _device_row_index(self, device_id) -> int:
+        """Liefert die Modellzeile zur device_id (oder -1)."""
+
+        row = self._device_index.get(device_id)
+        return -1 if row is None else row
 
     def _erase_method_label(self, device: Dict) -> str:
         """
@@ -686,10 +1080,10 @@ class MainWindow(QMainWindow):
 
     def selected_devices(self) -> List[Dict]:
         result = []
+        mapToSource = self._device_proxy.mapToSource
+        device_at = self._device_model.device_at
         for idx in self.device_table.selectionModel().selectedRows():
-            row = idx.row()
-            item = self.device_table.item(row, 0)
-            dev = item.data(Qt.UserRole) if item else None
+            dev = device_at(mapToSource(idx).row())
             if dev:
                 result.append(dev)
         return result
@@ -701,7 +1095,14 @@ class MainWindow(QMainWindow):
         return devices[0]
 
     def _device_target(self, dev: Dict) -> str:
-        return dev.get("target") or dev.get("path") or dev.get("device")
+        # _target wird beim Scan-Merge vorberechnet; der Fallback greift nur
+        # für Dicts, die nicht über _on_scan_done gelaufen sind
+        return (
+            dev.get("_target")
+            or dev.get("target")
+            or dev.get("path")
+            or dev.get("device")
+        )
 
     def _selected_tool(self) -> tuple[str, str]:
         if hasattr(self, "erase_tool_combo"):
@@ -739,18 +1140,15 @@ class MainWindow(QMainWindow):
 
     def _validate_tool_standard(self, tool: str, standard: str) -> bool:
         """Validiert, ob die gewählte Kombination unterstützt wird."""
-        supported = {key: {value for _, value in values} for key, values in self._standard_options.items()}
-        allowed = supported.get(tool, set())
-        if standard in allowed:
+        if tool in self._standard_to_tools.get(standard, frozenset()):
             return True
 
-        QMessageBox.warning(
-            self,
-            "Nicht unterstützt",
-            "Die gewählte Löschmethode wird vom ausgewählten Tool nicht unterstützt.",
-        )
+        self._warn_unsupported()
         return False
 
+    def _warn_unsupported(self) -> None:
+        self._unsupported_box.exec()
+
     def _ensure_devices_selected(self) -> List[Dict] | None:
         devices = self.selected_devices()
         if not devices:
@@ -765,8 +1163,10 @@ class MainWindow(QMainWindow):
             self.debug_logger.error("Runner-Fehler: %s", exc)
 
     def _filter_erasable(self, devices: List[Dict]) -> List[Dict] | None:
-        selected_for_erase = [d for d in devices if d.get("erase_allowed")]
-        forbidden = [d for d in devices if not d.get("erase_allowed")]
+        selected_for_erase: List[Dict] = []
+        forbidden: List[Dict] = []
+        for d in devices:
+            (selected_for_erase if d.get("erase_allowed") else forbidden).append(d)
 
         if not selected_for_erase:
             QMessageBox.information(
@@ -784,72 +1184,224 @@ class MainWindow(QMainWindow):
             )
         return selected_for_erase
 
+    def _pending_sel_update(self, *args) -> None:
+        if not self._sel_timer.isActive():
+            self._sel_timer.start(0)
+
     def _update_action_buttons(self) -> None:
+        # Während eines Batches bleiben die Kacheln gesperrt; Auswahl-
+        # Änderungen dürfen die Sperre nicht mittendrin wieder aufheben
+        if self._running_batches:
+            return
+        mapToSource = self._device_proxy.mapToSource
+        device_at = self._device_model.device_at
         has_erasable = False
         for idx in self.device_table.selectionModel().selectedRows():
-            item = self.device_table.item(idx.row(), 0)
-            dev = item.data(Qt.UserRole) if item else None
+            dev = device_at(mapToSource(idx).row())
             if dev and dev.get("erase_allowed"):
                 has_erasable = True
                 break
 
-        for btn in [
-            getattr(self, "btn_nwipe", None),
-            getattr(self, "btn_secure", None),
-            getattr(self, "btn_fio", None),
-            getattr(self, "btn_badblocks", None),
-        ]:
-            if btn is None:
-                continue
+        # Unveränderter Zustand: kein setEnabled und damit kein Style-Repolish
+        if has_erasable == self._prev_action_state:
+            return
+        self._prev_action_state = has_erasable
+        for btn in self._erase_buttons:
             btn.setEnabled(has_erasable)
 
     def _storcli_warning_text(self, exc: Exception) -> str:
-        message = str(exc)
-        if "storcli-Binary nicht gefunden" in message:
+        if isinstance(exc, raid_storcli.StorCLINotFoundError):
             return "StorCLI nicht installiert/gefunden"
-        if "sudo-Passwort nicht konfiguriert" in message or "sudo-Authentifizierung fehlgeschlagen" in message:
+        if isinstance(exc, raid_storcli.StorCLISudoError):
             return "StorCLI: Sudo-Authentifizierung fehlgeschlagen (Passwort in den Einstellungen prüfen)"
-        return f"StorCLI fehlgeschlagen: {message}"
+        return _storcli_fallback_warning(str(exc))
 
     def _handle_jbod_exception(self, exc: Exception) -> None:
-        if str(exc) == "storcli-jbod-unsupported":
+        if isinstance(exc, raid_storcli.StorCLIJBODUnsupportedError):
             self._append_status("JBOD auf Controller nicht unterstützt oder bereits gesetzt.")
             return
         self._append_status(f"StorCLI JBOD-Fehler: {exc}")
 
     def _restore_window_state(self) -> None:
+        if self._restore_consolidated_ui_state():
+            return
+        # Legacy-Fallback: einzelne Hex-Keys aus älteren Konfigurationen
         geometry_hex = self.config.get("window_geometry")
         if geometry_hex:
-            self.restoreGeometry(QByteArray.fromHex(str(geometry_hex).encode()))
+            self.restoreGeometry(_state_to_qba(str(geometry_hex)))
 
         splitter_state = self.config.get("splitter_state") or {}
         if isinstance(splitter_state, dict):
             main_state = splitter_state.get("main")
             if main_state:
-                self.main_splitter.restoreState(QByteArray.fromHex(str(main_state).encode()))
+                self.main_splitter.restoreState(_state_to_qba(str(main_state)))
             bottom_state = splitter_state.get("bottom") or splitter_state.get("left")
             if bottom_state:
-                self.bottom_splitter.restoreState(QByteArray.fromHex(str(bottom_state).encode()))
+                self.bottom_splitter.restoreState(_state_to_qba(str(bottom_state)))
 
         header_state = self.config.get("table_header_state")
         if header_state:
             try:
-                ba = QByteArray.fromHex(str(header_state).encode("ascii"))
-                self.device_table.horizontalHeader().restoreState(ba)
+                self.device_table.horizontalHeader().restoreState(_state_to_qba(str(header_state)))
             except Exception:  # pragma: no cover - defensive
                 pass
 
         widths = self.config.get("table_column_widths") or []
         for idx, width in enumerate(widths):
-            if idx < self.device_table.columnCount() and width:
+            if idx < self._device_proxy.columnCount() and width:
                 self.device_table.setColumnWidth(idx, width)
 
         sort_cfg = self.config.get("table_sort") or {}
         column = sort_cfg.get("column", 0)
         order = sort_cfg.get("order", "asc")
-        if 0 <= column < self.device_table.columnCount():
+        if 0 <= column < self._device_proxy.columnCount():
+            sort_order = Qt.DescendingOrder if order == "desc" else Qt.AscendingOrder
+            self.device_table.horizontalHeader().setSortIndicator(column, sort_order)
+
+    def _configured_column_widths(self) -> List[int]:
+        """Spaltenbreiten aus dem konsolidierten Blob bzw. den Legacy-Keys."""
+
+        blobs = self.config.get("ui_state")
+        if isinstance(blobs, dict):
+            return list(blobs.get("table_column_widths") or [])
+        return list(self.config.get("table_column_widths") or [])
+
+    def _restore_consolidated_ui_state(self) -> bool:
+        """Stellt den gesamten UI-Zustand aus dem konsolidierten Blob her."""
+
+        blobs = self.config.get("ui_state")
+        # Ältere Versionen speicherten hier einen undurchsichtigen String;
+        # der wird ignoriert und beim nächsten Speichern ersetzt.
+        if not isinstance(blobs, dict):
+            return False
+
+        geometry = blobs.get("window_geometry")
+        if geometry:
+            self.restoreGeometry(_b64_to_qba(str(geometry)))
+        main_state = blobs.get("splitter_main")
+        if main_state:
+            self.main_splitter.restoreState(_b64_to_qba(str(main_state)))
+        bottom_state = blobs.get("splitter_bottom")
+        if bottom_state:
+            self.bottom_splitter.restoreState(_b64_to_qba(str(bottom_state)))
+        header_state = blobs.get("table_header_state")
+        if header_state:
+            try:
+                self.device_table.horizontalHeader().restoreState(_b64_to_qba(str(header_state)))
+            except Exception:  # pragma: no cover - defensive
+                pass
+
+        for idx, width in enumerate(blobs.get("table_column_widths") or []):
+            if idx < self._device_proxy.columnCount() and width:
+                self.device_table.setColumnWidth(idx, width)
+
+        sort_cfg = blobs.get("table_sort") or {}
+        column = sort_cfg.get("column", 0)
+        order = sort_cfg.get("order", "asc")
+        if 0 <= column < self._device_proxy.columnCount():
             sort_order = Qt.DescendingOrder if order == "desc" else Qt.AscendingOrder
             self.device_table.horizontalHeader().setSortIndicator(column, sort_order)
+        return True
+
+    def _connect_ui_state_tracking(self) -> None:
+        """Merkt sich, ob der Benutzer Layout/Sortierung verändert hat.
+
+        Nur dann muss _persist_ui_state beim Schließen überhaupt
+        serialisieren und auf die Platte schreiben.
+        """
+
+        header = self.device_table.horizontalHeader()
+        for signal in (
+            self.main_splitter.splitterMoved,
+            self.bottom_splitter.splitterMoved,
+            header.sectionResized,
+            header.sectionMoved,
+            header.sortIndicatorChanged,
+        ):
+            signal.connect(self._mark_ui_dirty)
+
+    def _mark_ui_dirty(self, *args) -> None:
+        self._ui_dirty = True
+
+    def resizeEvent(self, event):
+        self._ui_dirty = True
+        super().resizeEvent(event)
+
+    def moveEvent(self, event):
+        self._ui_dirty = True
+        super().moveEvent(event)
+
+    # --- Hintergrund-Ausführung der blockierenden Runner ------------------
+    def _submit_device_jobs(self, devices: List[Dict], job_fn, on_finished, on_failed) -> None:
+        """Verteilt Runner-Aufrufe pro Gerät auf den Threadpool.
+
+        Die Abschluss-Handler laufen über die Signal-Verbindung wieder im
+        GUI-Thread und aktualisieren über _apply_device_updates nur die
+        betroffenen Zellen; nach dem letzten Job werden Snapshot/Summary
+        einmalig aufgefrischt und die Aktions-Buttons reaktiviert.
+        """
+
+        signals = _DeviceJobSignals(pending=len(devices))
+        # Referenz halten, sonst räumt Python die Signal-Quelle vorzeitig ab
+        self._active_job_signals.add(signals)
+        self._running_batches += 1
+        self._set_batch_running(True)
+        signals.finished.connect(
+            lambda dev, result, s=signals: self._dispatch_job_result(on_finished, dev, result, s)
+        )
+        signals.failed.connect(
+            lambda dev, exc, s=signals: self._dispatch_job_result(on_failed, dev, exc, s)
+        )
+        for dev in devices:
+            self._thread_pool.start(_DeviceJob(dev, job_fn, signals))
+
+    def _dispatch_job_result(self, handler, device: Dict, payload, signals) -> None:
+        # Batch-Kontext für _show_batch_error; sichern/zurücksetzen statt
+        # nur löschen, weil der modale Fehlerdialog Events nachschieben kann
+        previous_batch = self._dispatching_batch
+        self._dispatching_batch = signals
+        try:
+            handler(device, payload)
+        finally:
+            self._dispatching_batch = previous_batch
+            signals.pending -= 1
+            if signals.pending <= 0:
+                self._active_job_signals.discard(signals)
+                if self._devices_changed:
+                    self._export_device_snapshot()
+                    self._devices_changed = False
+                self._update_summary()
+                self._running_batches -= 1
+                if self._running_batches <= 0:
+                    self._running_batches = 0
+                    self._set_batch_running(False)
+
+    def _set_batch_running(self, running: bool) -> None:
+        self.btn_refresh.setEnabled(not running)
+        if not self._erase_buttons:
+            return  # Tile-Gruppen noch nicht aufgebaut
+        if running:
+            for btn in self._erase_buttons + (self.btn_fio_stress,):
+                btn.setEnabled(False)
+        else:
+            # Der Stresstest hängt nicht an der Auswahl und war vor dem
+            # Batch bedingungslos aktiv
+            self.btn_fio_stress.setEnabled(True)
+            # Zwangsweise deaktiviert – Zustands-Cache invalidieren
+            self._prev_action_state = None
+            self._update_action_buttons()
+
+    def _show_batch_error(self, exc: Exception) -> None:
+        """Zeigt den Fehlerdialog nur einmal pro Batch, loggt aber jeden Fehler."""
+
+        self.status_logger.error(str(exc))
+        self.debug_logger.error("Runner-Fehler: %s", exc)
+        batch = self._dispatching_batch
+        if batch is not None:
+            if batch.error_shown:
+                return
+            batch.error_shown = True
+        QMessageBox.critical(self, "Fehler", str(exc))
 
     def run_secure_erase(self):
         devices = self._ensure_devices_selected()
@@ -877,102 +1429,106 @@ class MainWindow(QMainWindow):
         planner.expert_enabled = self.expert_mode.enabled
         if not planner.confirm_devices(self, devices, tool_label, standard_label):
             return
-        try:
-            for dev in devices:
-                dev_for_cmd = dev.copy()
-                plan = planner.map_standard_to_commands(dev_for_cmd, standard_value)
-                dev_for_cmd["device"] = plan.get("target")
-                dev["target"] = plan.get("target")
-                result = secure_erase.execute_commands(plan.get("commands", []))
-                updates = {
-                    "erase_ok": result.get("ok"),
-                    "erase_timestamp": result.get("timestamp"),
-                    "erase_method": plan.get("method"),
-                    "erase_standard": plan.get("standard", standard_label),
-                    "erase_tool": tool_value,
-                    "command": result.get("command"),
-                    "timestamp": result.get("timestamp"),
-                    "start_timestamp": result.get("start_timestamp"),
-                    "mapping_hint": plan.get("mapping_hint"),
-                }
-                if result.get("error"):
-                    self.debug_logger.error("Secure Erase Fehler: %s", result.get("error"))
-                self._apply_device_updates(dev, updates)
-                status_fn = self.status_logger.success if result.get("ok") else self.status_logger.error
-                status_fn(
-                    f"Secure Erase ausgeführt für {dev['device']} ({plan.get('target')}) – OK={result.get('ok')}"
-                )
-                self._log_device_event(dev, updates)
-            self._populate_table()
-        except RuntimeError as exc:
+
+        def job(dev: Dict) -> Dict:
+            dev_for_cmd = dev.copy()
+            plan = planner.map_standard_to_commands(dev_for_cmd, standard_value)
+            dev_for_cmd["device"] = plan.get("target")
+            result = secure_erase.execute_commands(plan.get("commands", []))
+            return {"plan": plan, "result": result}
+
+        def on_finished(dev: Dict, payload: Dict) -> None:
+            plan = payload["plan"]
+            result = payload["result"]
+            updates = {
+                # Über _apply_device_updates statt Direktzuweisung im Job:
+                # läuft im GUI-Thread und hält dev['_target'] aktuell
+                "target": plan.get("target"),
+                "erase_ok": result.get("ok"),
+                "erase_timestamp": result.get("timestamp"),
+                "erase_method": plan.get("method"),
+                "erase_standard": plan.get("standard", standard_label),
+                "erase_tool": tool_value,
+                "command": result.get("command"),
+                "timestamp": result.get("timestamp"),
+                "start_timestamp": result.get("start_timestamp"),
+                "mapping_hint": plan.get("mapping_hint"),
+            }
+            if result.get("error"):
+                self.debug_logger.error("Secure Erase Fehler: %s", result.get("error"))
+            self._apply_device_updates(dev, updates)
+            status_fn = self.status_logger.success if result.get("ok") else self.status_logger.error
+            status_fn(
+                f"Secure Erase ausgeführt für {dev['device']} ({plan.get('target')}) – OK={result.get('ok')}"
+            )
+            self._log_device_event(dev, updates)
+
+        def on_failed(dev: Dict, exc: Exception) -> None:
             now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            for dev in devices:
-                updates = {
-                    "erase_method": "Secure Erase (ATA/NVMe)",
-                    "erase_standard": standard_label,
-                    "erase_ok": False,
-                    "erase_tool": tool_value,
-                    "command": "",
-                    "timestamp": now,
-                    "start_timestamp": now,
-                }
-                self._apply_device_updates(dev, updates)
-                self._log_device_event(dev, updates)
-            self._populate_table()
-            self._handle_runner_error(exc)
+            updates = {
+                "erase_method": "Secure Erase (ATA/NVMe)",
+                "erase_standard": standard_label,
+                "erase_ok": False,
+                "erase_tool": tool_value,
+                "command": "",
+                "timestamp": now,
+                "start_timestamp": now,
+            }
+            self._apply_device_updates(dev, updates)
+            self._log_device_event(dev, updates)
+            self._show_batch_error(exc)
+
+        self._submit_device_jobs(devices, job, on_finished, on_failed)
 
     def _run_badblocks_destructive(
         self, devices: List[Dict], standard_value: str, standard_label: str
     ) -> None:
-        if standard_value != "zero-fill":
-            QMessageBox.warning(
-                self,
-                "Nicht unterstützt",
-                "Die gewählte Löschmethode wird vom ausgewählten Tool nicht unterstützt.",
-            )
+        if "badblocks" not in self._standard_to_tools.get(standard_value, frozenset()):
+            self._warn_unsupported()
             return
-        try:
-            for dev in devices:
-                result = badblocks_runner.run_badblocks(dev, "destructive", erase_standard=standard_label)
-                updates = {
-                    "erase_ok": result.get("ok"),
-                    "erase_timestamp": result.get("timestamp"),
-                    "erase_method": result.get("method"),
-                    "erase_standard": standard_label or result.get("method"),
-                    "erase_tool": "badblocks",
-                    "command": result.get("command"),
-                    "timestamp": result.get("timestamp"),
-                    "start_timestamp": result.get("start_timestamp"),
-                }
-                if not result.get("ok"):
-                    self.debug_logger.error(
-                        "Badblocks Destructive fehlgeschlagen für %s: %s", dev.get("device"), result.get("stderr")
-                    )
-                self._apply_device_updates(dev, updates)
-                target = result.get("target") or dev.get("target") or dev.get("device")
-                status_fn = self.status_logger.success if result.get("ok") else self.status_logger.error
-                status_fn(
-                    f"Badblocks Destructive auf {dev['device']} ({target}) – OK={result.get('ok')}"
+        def job(dev: Dict) -> Dict:
+            return badblocks_runner.run_badblocks(dev, "destructive", erase_standard=standard_label)
+
+        def on_finished(dev: Dict, result: Dict) -> None:
+            updates = {
+                "erase_ok": result.get("ok"),
+                "erase_timestamp": result.get("timestamp"),
+                "erase_method": result.get("method"),
+                "erase_standard": standard_label or result.get("method"),
+                "erase_tool": "badblocks",
+                "command": result.get("command"),
+                "timestamp": result.get("timestamp"),
+                "start_timestamp": result.get("start_timestamp"),
+            }
+            if not result.get("ok"):
+                self.debug_logger.error(
+                    "Badblocks Destructive fehlgeschlagen für %s: %s", dev.get("device"), result.get("stderr")
                 )
-                self._log_device_event(dev, updates)
-            self._populate_table()
-        except RuntimeError as exc:
+            self._apply_device_updates(dev, updates)
+            target = result.get("target") or self._device_target(dev)
+            status_fn = self.status_logger.success if result.get("ok") else self.status_logger.error
+            status_fn(
+                f"Badblocks Destructive auf {dev['device']} ({target}) – OK={result.get('ok')}"
+            )
+            self._log_device_event(dev, updates)
+
+        def on_failed(dev: Dict, exc: Exception) -> None:
             now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            for dev in devices:
-                updates = {
-                    "erase_ok": False,
-                    "erase_timestamp": now,
-                    "erase_method": "Badblocks Destructive",
-                    "erase_standard": standard_label,
-                    "erase_tool": "badblocks",
-                    "command": "",
-                    "timestamp": now,
-                    "start_timestamp": now,
-                }
-                self._apply_device_updates(dev, updates)
-                self._log_device_event(dev, updates)
-            self._populate_table()
-            self._handle_runner_error(exc)
+            updates = {
+                "erase_ok": False,
+                "erase_timestamp": now,
+                "erase_method": "Badblocks Destructive",
+                "erase_standard": standard_label,
+                "erase_tool": "badblocks",
+                "command": "",
+                "timestamp": now,
+                "start_timestamp": now,
+            }
+            self._apply_device_updates(dev, updates)
+            self._log_device_event(dev, updates)
+            self._show_batch_error(exc)
+
+        self._submit_device_jobs(devices, job, on_finished, on_failed)
 
     def _run_fio_for_devices(self, preset: str, label: str) -> None:
         devices = self._ensure_devices_selected()
@@ -981,44 +1537,33 @@ class MainWindow(QMainWindow):
         devices = self._filter_erasable(devices)
         if not devices:
             return
-        try:
-            for dev in devices:
-                start_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self.status_logger.info(
-                    f"INFO: FIO gestartet ({label}) auf {dev.get('device')} ({self._device_target(dev)})"
-                )
-                result = fio_runner.run_preset_with_result(dev, preset)
-                end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                if result.get("target"):
-                    dev["target"] = result.get("target")
-                if result.get("mapping_hint"):
-                    dev["mapping_hint"] = result.get("mapping_hint")
-                if not result.get("ok"):
-                    error_hint = result.get("error") or "FIO konnte keine Kennzahlen liefern."
-                    updates = {
-                        "fio_bw": None,
-                        "fio_iops": None,
-                        "fio_lat": None,
-                        "fio_ok": False,
-                        "command": result.get("command"),
-                        "mapping_hint": result.get("mapping_hint", ""),
-                        "start_timestamp": start_time,
-                        "end_timestamp": end_time,
-                        "timestamp": end_time,
-                    }
-                    self._apply_device_updates(dev, updates)
-                    self._log_device_event(dev, updates)
-                    self.debug_logger.error(
-                        "FIO-Fehler für %s: %s", dev.get("device"), error_hint
-                    )
-                    raise RuntimeError(
-                        f"FIO konnte nicht abgeschlossen werden – Details im Debug-Log. Fehler: {error_hint}"
-                    )
+        for dev in devices:
+            self.status_logger.info(
+                f"INFO: FIO gestartet ({label}) auf {dev.get('device')} ({self._device_target(dev)})"
+            )
+
+        def job(dev: Dict) -> Dict:
+            start_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            result = fio_runner.run_preset_with_result(dev, preset)
+            end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            return {"result": result, "start": start_time, "end": end_time}
+
+        def on_finished(dev: Dict, payload: Dict) -> None:
+            result = payload["result"]
+            start_time = payload["start"]
+            end_time = payload["end"]
+            if result.get("target"):
+                # Hält neben 'target' auch das vorberechnete '_target' aktuell
+                self._apply_device_updates(dev, {"target": result.get("target")})
+            if result.get("mapping_hint"):
+                dev["mapping_hint"] = result.get("mapping_hint")
+            if not result.get("ok"):
+                error_hint = result.get("error") or "FIO konnte keine Kennzahlen liefern."
                 updates = {
-                    "fio_bw": round(result.get("bw_mb_s"), 2) if result.get("bw_mb_s") is not None else None,
-                    "fio_iops": round(result.get("iops"), 2) if result.get("iops") is not None else None,
-                    "fio_lat": round(result.get("lat_ms"), 3) if result.get("lat_ms") is not None else None,
-                    "fio_ok": result.get("ok"),
+                    "fio_bw": None,
+                    "fio_iops": None,
+                    "fio_lat": None,
+                    "fio_ok": False,
                     "command": result.get("command"),
                     "mapping_hint": result.get("mapping_hint", ""),
                     "start_timestamp": start_time,
@@ -1026,15 +1571,39 @@ class MainWindow(QMainWindow):
                     "timestamp": end_time,
                 }
                 self._apply_device_updates(dev, updates)
-                self.status_logger.info(
-                    f"INFO: FIO-Ergebnis für {dev['device']} – "
-                    f"{result.get('bw_mb_s', '–')} MB/s, {result.get('iops', '–')} IOPS, "
-                    f"{result.get('lat_ms', '–')} ms, OK={result.get('ok')}"
-                )
                 self._log_device_event(dev, updates)
-            self._populate_table()
-        except RuntimeError as exc:
-            self._handle_runner_error(exc)
+                self.debug_logger.error(
+                    "FIO-Fehler für %s: %s", dev.get("device"), error_hint
+                )
+                self._show_batch_error(
+                    RuntimeError(
+                        f"FIO konnte nicht abgeschlossen werden – Details im Debug-Log. Fehler: {error_hint}"
+                    )
+                )
+                return
+            updates = {
+                "fio_bw": round(result.get("bw_mb_s"), 2) if result.get("bw_mb_s") is not None else None,
+                "fio_iops": round(result.get("iops"), 2) if result.get("iops") is not None else None,
+                "fio_lat": round(result.get("lat_ms"), 3) if result.get("lat_ms") is not None else None,
+                "fio_ok": result.get("ok"),
+                "command": result.get("command"),
+                "mapping_hint": result.get("mapping_hint", ""),
+                "start_timestamp": start_time,
+                "end_timestamp": end_time,
+                "timestamp": end_time,
+            }
+            self._apply_device_updates(dev, updates)
+            self.status_logger.info(
+                f"INFO: FIO-Ergebnis für {dev['device']} – "
+                f"{result.get('bw_mb_s', '–')} MB/s, {result.get('iops', '–')} IOPS, "
+                f"{result.get('lat_ms', '–')} ms, OK={result.get('ok')}"
+            )
+            self._log_device_event(dev, updates)
+
+        def on_failed(dev: Dict, exc: Exception) -> None:
+            self._show_batch_error(exc)
+
+        self._submit_device_jobs(devices, job, on_finished, on_failed)
 
     def run_fio(self):
         preset = self.config.get("default_fio_preset", "quick-read")
@@ -1087,29 +1656,13 @@ class MainWindow(QMainWindow):
         except RuntimeError as exc:
             self._handle_runner_error(exc)
 
-    def run_smartctl_cli(self):
-        devices = self._ensure_devices_selected()
-        if not devices:
-            return
-        try:
-            for dev in devices:
-                target = dev.get("target") or dev["device"]
-                smart_tools.launch_smart_cli(target)
-                self.status_logger.info(f"SMART Scan gestartet für {dev['device']}")
-        except RuntimeError as exc:
-            self._handle_runner_error(exc)
+    @per_device_action("SMART Scan")
+    def run_smartctl_cli(self, dev: Dict) -> None:
+        smart_tools.launch_smart_cli(self._device_target(dev))
 
-    def run_nvme_info(self):
-        devices = self._ensure_devices_selected()
-        if not devices:
-            return
-        try:
-            for dev in devices:
-                target = dev.get("target") or dev["device"]
-                smart_tools.launch_nvme_cli(target)
-                self.status_logger.info(f"NVMe Info gestartet für {dev['device']}")
-        except RuntimeError as exc:
-            self._handle_runner_error(exc)
+    @per_device_action("NVMe Info")
+    def run_nvme_info(self, dev: Dict) -> None:
+        smart_tools.launch_nvme_cli(self._device_target(dev))
 
     def run_badblocks(self):
         devices = self._ensure_devices_selected()
@@ -1129,28 +1682,31 @@ class MainWindow(QMainWindow):
             devices = self._filter_erasable(devices)
             if not devices:
                 return
-        try:
-            for dev in devices:
-                result = badblocks_runner.run_badblocks(dev, mode)
-                updates = {
-                    "erase_ok": result.get("ok"),
-                    "erase_timestamp": result.get("timestamp"),
-                    "erase_method": result.get("method"),
-                    "erase_standard": result.get("erase_standard", result.get("method")),
-                    "erase_tool": "badblocks",
-                    "command": result.get("command"),
-                    "timestamp": result.get("timestamp"),
-                    "start_timestamp": result.get("start_timestamp"),
-                }
-                self._apply_device_updates(dev, updates)
-                target = result.get("target") or dev.get("target") or dev.get("device")
-                self.status_logger.info(
-                    f"Badblocks abgeschlossen ({mode}) auf {dev['device']} ({target}) – OK={result.get('ok')}"
-                )
-                self._log_device_event(dev, updates)
-            self._populate_table()
-        except RuntimeError as exc:
-            self._handle_runner_error(exc)
+        def job(dev: Dict) -> Dict:
+            return badblocks_runner.run_badblocks(dev, mode)
+
+        def on_finished(dev: Dict, result: Dict) -> None:
+            updates = {
+                "erase_ok": result.get("ok"),
+                "erase_timestamp": result.get("timestamp"),
+                "erase_method": result.get("method"),
+                "erase_standard": result.get("erase_standard", result.get("method")),
+                "erase_tool": "badblocks",
+                "command": result.get("command"),
+                "timestamp": result.get("timestamp"),
+                "start_timestamp": result.get("start_timestamp"),
+            }
+            self._apply_device_updates(dev, updates)
+            target = result.get("target") or self._device_target(dev)
+            self.status_logger.info(
+                f"Badblocks abgeschlossen ({mode}) auf {dev['device']} ({target}) – OK={result.get('ok')}"
+            )
+            self._log_device_event(dev, updates)
+
+        def on_failed(dev: Dict, exc: Exception) -> None:
+            self._show_batch_error(exc)
+
+        self._submit_device_jobs(devices, job, on_finished, on_failed)
 
     def run_nwipe(self):
         devices = self._ensure_devices_selected()
@@ -1174,16 +1730,18 @@ class MainWindow(QMainWindow):
             self.status_logger.info(f"Nwipe gestartet auf {', '.join(targets)}")
             command = erase_result.get("command") or f"nwipe --sync --verify=last {' '.join(targets)}"
             timestamp = erase_result.get("timestamp") or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            # Ein Nwipe-Lauf liefert für alle Geräte dasselbe Ergebnis –
+            # das Update-Dict einmal bauen statt pro Gerät
+            updates = {
+                "erase_method": erase_result.get("erase_method", "Nwipe"),
+                "erase_standard": erase_result.get("erase_standard", standard_label),
+                "erase_tool": "nwipe",
+                "erase_ok": erase_result.get("erase_ok"),
+                "command": command,
+                "timestamp": timestamp,
+                "start_timestamp": erase_result.get("start_timestamp", timestamp),
+            }
             for dev in devices:
-                updates = {
-                    "erase_method": erase_result.get("erase_method", "Nwipe"),
-                    "erase_standard": erase_result.get("erase_standard", standard_label),
-                    "erase_tool": "nwipe",
-                    "erase_ok": erase_result.get("erase_ok"),
-                    "command": command,
-                    "timestamp": timestamp,
-                    "start_timestamp": erase_result.get("start_timestamp", timestamp),
-                }
                 self._apply_device_updates(dev, updates)
                 self._log_device_event(dev, updates)
             self._update_summary()
@@ -1192,8 +1750,7 @@ class MainWindow(QMainWindow):
 
     def reboot_shredos(self):
         device = self.config.get("shredos_device", "/dev/sdb1")
-        current_devices = getattr(self, "devices", [])
-        target_info = next((d for d in current_devices if d.get("path") == device or d.get("device") == device), None)
+        target_info = self._devices_by_path.get(device) or self._devices_by_device.get(device)
         if target_info and not target_info.get("erase_allowed"):
             QMessageBox.information(
                 self,
@@ -1224,14 +1781,9 @@ class MainWindow(QMainWindow):
         self._show_json_dialog("StorCLI Übersicht", data)
 
     def show_storcli_physical(self):
-        merged = {}
         try:
-            controllers = raid_storcli.list_controllers()
-            for ctrl in controllers:
-                cid = ctrl.get("id")
-                if cid is None:
-                    continue
-                merged[cid] = raid_storcli.list_physical_drives(cid)
+            # Ein /call-Aufruf statt 2N+1 Einzelaufrufe pro Controller
+            merged = raid_storcli.list_all_physical_drives()
         except Exception as exc:  # pragma: no cover - defensive
             self.status_logger.error(f"StorCLI Physical fehlgeschlagen: {exc}")
             self.status_label.setText(self._storcli_warning_text(exc))
@@ -1247,59 +1799,88 @@ class MainWindow(QMainWindow):
             self.status_logger.info("JBOD-Befehl ausgeführt")
         except Exception as exc:  # pragma: no cover - defensive
             self.status_logger.error(f"StorCLI JBOD-Fehler: {exc}")
-            if str(exc) == "storcli-jbod-unsupported":
+            if isinstance(exc, raid_storcli.StorCLIJBODUnsupportedError):
                 self.status_label.setText("JBOD nicht unterstützt oder bereits aktiv")
             else:
                 self.status_label.setText(self._storcli_warning_text(exc))
         self._reload_devices()
 
     def _show_json_dialog(self, title: str, data):
-        pretty = json.dumps(data, indent=2, ensure_ascii=False) if data else "Keine Daten"
-        QMessageBox.information(self, title, pretty)
+        # Große StorCLI-Dumps nicht im GUI-Thread serialisieren
+        signals = _DeviceJobSignals()
+        self._active_job_signals.add(signals)
+        signals.finished.connect(
+            lambda shown_title, pretty, s=signals: self._display_json_dialog(shown_title, pretty, s)
+        )
+        signals.failed.connect(
+            lambda shown_title, exc, s=signals: self._display_json_dialog(shown_title, str(exc), s)
+        )
+
+        def job(_title) -> str:
+            return json.dumps(data, indent=2, ensure_ascii=False) if data else "Keine Daten"
+
+        self._thread_pool.start(_DeviceJob(title, job, signals))
+
+    def _display_json_dialog(self, title: str, pretty: str, signals) -> None:
+        self._active_job_signals.discard(signals)
+        dialog = JsonViewerDialog(title, pretty, self)
+        dialog.show()
 
     def launch_cert_gui(self):
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        script = os.path.join(base_dir, "certificates", "export_certificates_gui.py")
+        script = _CERT_GUI_SCRIPT
         if not os.path.exists(script):
             QMessageBox.warning(self, "Zertifikat GUI", f"Script nicht gefunden:\n{script}")
             return
-        try:
-            subprocess.Popen([sys.executable, script])
-        except Exception as exc:  # pragma: no cover - defensive
+        # Fire-and-forget über Qt statt Popen: kein Python-seitiges Warten,
+        # der Prozess überlebt das Hauptfenster
+        if not QProcess.startDetached(sys.executable, [script]):
             QMessageBox.warning(
-                self, "Zertifikat GUI", f"Script konnte nicht gestartet werden:\n{exc}"
+                self, "Zertifikat GUI", f"Script konnte nicht gestartet werden:\n{script}"
             )
 
     def open_log_folder(self):
         folder = config_manager.get_log_dir(self.config)
         if folder:
-            os.system(f"xdg-open '{folder}' &")
+            # Über das Desktop-Portal statt xdg-open: kein Fork, kein Quoting
+            QDesktopServices.openUrl(QUrl.fromLocalFile(folder))
 
     def _persist_ui_state(self) -> None:
-        self.config["window_geometry"] = bytes(self.saveGeometry().toHex()).decode("ascii")
-        self.config["splitter_state"] = {
-            "main": bytes(self.main_splitter.saveState().toHex()).decode("ascii"),
-            "bottom": bytes(self.bottom_splitter.saveState().toHex()).decode("ascii"),
-        }
-        # Legacy Key für ältere Konfigurationsdateien beibehalten
-        self.config["splitter_state"]["left"] = self.config["splitter_state"]["bottom"]
-        self.config["table_column_widths"] = [
-            self.device_table.columnWidth(i) for i in range(self.device_table.columnCount())
-        ]
-        self.config["table_header_state"] = bytes(
-            self.device_table.horizontalHeader().saveState().toHex()
-        ).decode("ascii")
         header = self.device_table.horizontalHeader()
         order = "desc" if header.sortIndicatorOrder() == Qt.DescendingOrder else "asc"
-        self.config["table_sort"] = {"column": header.sortIndicatorSection(), "order": order}
+        # Gebundene Locals: ein Attribut-Lookup statt zwei pro Spalte
+        column_width = self.device_table.columnWidth
+        column_count = self._device_proxy.columnCount()
+        # Alle UI-Zustände in einem Feld bündeln; Qt-Blobs als Base64
+        # (ein Drittel kompakter als Hex), Breiten/Sortierung als normales
+        # JSON. Bewusst kein Pickle: die Config ist eine benutzereditierbare
+        # JSON-Datei, deren Inhalt beim Start keinen Code ausführen darf.
+        blobs = {
+            "window_geometry": _qba_to_b64(self.saveGeometry()),
+            "splitter_main": _qba_to_b64(self.main_splitter.saveState()),
+            "splitter_bottom": _qba_to_b64(self.bottom_splitter.saveState()),
+            "table_header_state": _qba_to_b64(header.saveState()),
+            "table_column_widths": [column_width(i) for i in range(column_count)],
+            "table_sort": {"column": header.sortIndicatorSection(), "order": order},
+        }
+        # Unveränderte UI-Zustände nicht erneut auf die Platte schreiben
+        if self.config.get("ui_state") == blobs:
+            self._ui_dirty = False
+            return
+        self.config["ui_state"] = blobs
         save_config(self.config)
+        self._ui_dirty = False
 
     def open_settings(self):
-        win = SettingsWindow(self.config.copy(), self.apply_config, self.expert_mode)
-        win.show()
-        win.activateWindow()
-        win.raise_()
-        self.settings_window = win
+        if self.settings_window is None:
+            self.settings_window = SettingsWindow(self.config.copy(), self.apply_config, self.expert_mode)
+        else:
+            # Immer aus der aktuellen Config neu befüllen: verworfene
+            # Änderungen (inkl. eines getippten Sudo-Passworts) dürfen beim
+            # Wiederöffnen nicht stehen bleiben
+            self.settings_window.reload(self.config.copy())
+        self.settings_window.show()
+        self.settings_window.activateWindow()
+        self.settings_window.raise_()
 
     def apply_config(self, cfg: dict):
         self.config = cfg
@@ -1324,9 +1905,33 @@ class MainWindow(QMainWindow):
         self._update_expert_visibility()
 
     def on_refresh_clicked(self):
-        try:
-            raid_storcli.set_all_drives_to_jbod()
-        except Exception as exc:  # pragma: no cover - defensive
+        self._refresh_with_jbod()
+
+    def _refresh_with_jbod(self) -> None:
+        """Setzt JBOD im Threadpool und startet anschließend den Geräte-Scan.
+
+        set_all_drives_to_jbod kann auf Systemen mit mehreren Controllern
+        sekundenlang blockieren und gehört deshalb nicht in den GUI-Thread.
+        """
+
+        if self._scan_in_flight:
+            return
+        self.btn_refresh.setEnabled(False)
+        signals = _DeviceJobSignals()
+        self._active_job_signals.add(signals)
+        signals.finished.connect(
+            lambda _dev, _result, s=signals: self._on_jbod_done(None, s)
+        )
+        signals.failed.connect(
+            lambda _dev, exc, s=signals: self._on_jbod_done(exc, s)
+        )
+        self._thread_pool.start(
+            _DeviceJob(None, lambda _dev: raid_storcli.set_all_drives_to_jbod(), signals)
+        )
+
+    def _on_jbod_done(self, exc, signals) -> None:
+        self._active_job_signals.discard(signals)
+        if exc is not None:
             self._handle_jbod_exception(exc)
         self._reload_devices()
 
@@ -1336,5 +1941,11 @@ class MainWindow(QMainWindow):
         self._update_action_buttons()
 
     def closeEvent(self, event):
-        self._persist_ui_state()
+        # Ausstehende wipe_log-Einträge und Snapshots sicher auf Platte bringen
+        if self._snapshot_timer.isActive():
+            self._snapshot_timer.stop()
+            self._flush_snapshot()
+        self._log_queue.join()
+        if self._ui_dirty:
+            self._persist_ui_state()
         super().closeEvent(event)
@@ -1,4 +1,3 @@
-import shlex
 import subprocess
 
 from PySide6.QtWidgets import (
@@ -19,8 +18,26 @@ from PySide6.QtWidgets import (
 from modules import config_manager
 from modules.fio_runner import PRESETS as FIO_PRESETS
 
+# Einmal materialisieren statt pro Fensteraufbau über das Dict zu iterieren
+FIO_PRESET_NAMES = list(FIO_PRESETS.keys())
+
 
 class SettingsWindow(QWidget):
+    # Schema der einfachen Felder: Config-Key, Widget-Attribut, Getter,
+    # Setter, Default. save()/reload() laufen darüber, damit neue
+    # Einstellungen nur noch hier und im Formularaufbau ergänzt werden.
+    _FIELDS = (
+        ("cert_dir", "cert_dir", "text", "setText", ""),
+        ("log_dir", "log_dir", "text", "setText", ""),
+        ("debug_log", "debug_log", "text", "setText", ""),
+        ("debug_logging_enabled", "debug_enabled", "isChecked", "setChecked", True),
+        ("default_badblocks_mode", "badblocks_default", "currentText", "setCurrentText", "read-only"),
+        ("default_fio_preset", "fio_default", "currentText", "setCurrentText", "quick-read"),
+        ("expert_pin", "expert_pin", "text", "setText", "1969"),
+        ("show_system_disks", "show_system", "isChecked", "setChecked", False),
+        ("shredos_device", "shredos_device", "text", "setText", "/dev/sdb1"),
+    )
+
     def __init__(self, config: dict, on_save, expert_mode=None):
         super().__init__()
         self.config = config
@@ -70,7 +87,7 @@ class SettingsWindow(QWidget):
         form.addRow("Standard Badblocks", self.badblocks_default)
 
         self.fio_default = QComboBox()
-        self.fio_default.addItems(list(FIO_PRESETS.keys()))
+        self.fio_default.addItems(FIO_PRESET_NAMES)
         self.fio_default.setCurrentText(config.get("default_fio_preset", "quick-read"))
         form.addRow("Standard FIO", self.fio_default)
 
@@ -108,6 +125,23 @@ class SettingsWindow(QWidget):
 
         self.setLayout(layout)
 
+    def reload(self, config: dict) -> None:
+        """Übernimmt eine frische Konfiguration in die bestehenden Widgets.
+
+        Erlaubt dem Hauptfenster, die Instanz wiederzuverwenden, statt pro
+        Öffnen alle Widgets neu aufzubauen.
+        """
+
+        self.config = config
+        for key, attr, _getter, setter, default in self._FIELDS:
+            value = config.get(key, default)
+            if setter == "setChecked":
+                value = bool(value)
+            getattr(getattr(self, attr), setter)(value)
+        self.sudo_password.clear()
+        if self.expert_mode is not None:
+            self.expert_status.setText(self._expert_status_text())
+
     def _with_button(self, line_edit, button):
         container = QWidget()
         layout = QHBoxLayout()
@@ -125,15 +159,8 @@ class SettingsWindow(QWidget):
     def save(self):
         self.config.update(
             {
-                "cert_dir": self.cert_dir.text(),
-                "log_dir": self.log_dir.text(),
-                "debug_log": self.debug_log.text(),
-                "debug_logging_enabled": self.debug_enabled.isChecked(),
-                "default_badblocks_mode": self.badblocks_default.currentText(),
-                "default_fio_preset": self.fio_default.currentText(),
-                "expert_pin": self.expert_pin.text(),
-                "show_system_disks": self.show_system.isChecked(),
-                "shredos_device": self.shredos_device.text(),
+                key: getattr(getattr(self, attr), getter)()
+                for key, attr, getter, _setter, _default in self._FIELDS
             }
         )
         new_pw = self.sudo_password.text()
@@ -149,19 +176,26 @@ class SettingsWindow(QWidget):
         if not pw:
             QMessageBox.warning(self, "Sudo", "Bitte zuerst ein Sudo-Passwort eintragen.")
             return
-        pw_safe = shlex.quote(pw)
+        # Passwort direkt über stdin statt durch eine Shell: keine zweite
+        # Fork und kein Passwort in /proc/<pid>/cmdline
         try:
-            result = subprocess.run(
-                ["bash", "-lc", f"echo {pw_safe} | sudo -S true"],
-                capture_output=True,
-                text=True,
-                timeout=10,
+            proc = subprocess.Popen(
+                ["sudo", "-S", "-p", "", "true"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
-        except subprocess.SubprocessError:
+            try:
+                proc.communicate(input=(pw + "\n").encode(), timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.communicate()
+                raise
+        except (OSError, subprocess.SubprocessError):
             QMessageBox.critical(self, "Sudo", "Sudo-Test fehlgeschlagen.")
             return
 
-        if result.returncode == 0:
+        if proc.returncode == 0:
             QMessageBox.information(self, "Sudo", "Sudo-Authentifizierung erfolgreich.")
         else:
             QMessageBox.critical(self, "Sudo", "Sudo-Authentifizierung fehlgeschlagen.")